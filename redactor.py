@@ -11,10 +11,18 @@ Usage:
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import uuid
+import operator
 import os
-from collections import OrderedDict
+import queue
+import re
+import string
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from collections import OrderedDict, defaultdict, deque
+from contextlib import contextmanager
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple
+from typing import (Any, Callable, DefaultDict, Deque, Dict, Hashable, Iterable,
+                    Iterator, List, Optional, Set, Tuple)
 
 import fitz  # PyMuPDF
 from PIL import Image, ImageTk
@@ -23,13 +31,40 @@ from PIL import Image, ImageTk
 # Constants
 # ---------------------------------------------------------------------------
 
-RENDER_DPI = 150
+RENDER_DPI = 150  # Upper bound; pages render at the DPI that fits the canvas
+RENDER_SCALE = RENDER_DPI / 72.0  # Pixels per PDF point at RENDER_DPI
 DEFAULT_WINDOW_SIZE = "1200x800"
 MIN_WINDOW_WIDTH = 900
 MIN_WINDOW_HEIGHT = 600
 SIDEBAR_WIDTH = 280
 MIN_RECT_SIZE = 5  # Minimum pixel size to count as intentional draw
-CACHE_LIMIT = 5
+HIT_TOLERANCE = 3  # Pixels of slack around overlays for right-click removal
+HIT_GRID_CELL = 64  # PDF points per cell of the overlay hit-test grid
+CACHE_LIMIT = 16  # Rendered pages (PIL) kept in memory
+PHOTO_CACHE_LIMIT = 8  # Of those, how many are also kept as Tk images
+PREFETCH_DELAY_MS = 50
+RESIZE_DEBOUNCE_MS = 150
+WHEEL_FLUSH_MS = 16  # Mouse-wheel deltas are summed and applied once per frame
+SEARCH_CACHE_LIMIT = 200  # (page, term) entries
+SEARCH_RESULTS_CACHE_LIMIT = 32  # whole-document results, one per term
+TEXTPAGE_CACHE_LIMIT = 100  # Parsed pages kept for reuse across searches
+SEARCH_POLL_MS = 20  # How often the Tk thread collects background search hits
+SEARCH_POLL_BATCH = 50  # Max pages handled per poll, to keep the UI live
+
+# Characters MuPDF's search can match across (line breaks, soft hyphens);
+# stripped from both sides of the page-text prefilter so it never misses.
+INDEX_STRIP_RE = re.compile(r"[\s\-\u00ad]+")
+# MuPDF's search folds ASCII A-Z only ("É" never matches "é"), so queries
+# equal under this fold get identical hits and can share cached results.
+SEARCH_CASE_FOLD = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+# The flags page.search_for extracts text with when it builds its own
+# TextPage. Anything matched against its results must use the same ones.
+SEARCH_TEXT_FLAGS = (fitz.TEXT_DEHYPHENATE | fitz.TEXT_PRESERVE_WHITESPACE
+                     | fitz.TEXT_PRESERVE_LIGATURES | fitz.TEXT_MEDIABOX_CLIP)
+
+# (x0, y0, x1, y1) of a fitz.Rect in one call; used on every search hit
+_rect_of = operator.attrgetter("x0", "y0", "x1", "y1")
 
 # Visual style for redaction overlays
 REDACT_FILL = "red"
@@ -70,6 +105,15 @@ class RedactionRect:
             search_term=search_term,
         )
 
+    @staticmethod
+    def create_many(page_num: int,
+                    pdf_rects: List[Tuple[float, float, float, float]],
+                    source: str, search_term: str = "") -> List["RedactionRect"]:
+        """Create one redaction per rect on a page in a single pass."""
+        ids = [uuid.uuid4().hex[:8] for _ in pdf_rects]
+        return [RedactionRect(rid, page_num, pdf_rect, source, search_term)
+                for rid, pdf_rect in zip(ids, pdf_rects)]
+
     @property
     def description(self) -> str:
         if self.source == "search":
@@ -78,6 +122,20 @@ class RedactionRect:
         return f"({x0:.0f},{y0:.0f})-({x1:.0f},{y1:.0f})"
 
 
+@dataclass
+class SearchRun:
+    """Progress of one Find All, accumulated on the Tk thread."""
+
+    token: int
+    text: str
+    cache_key: Tuple[int, str]
+    results: Optional[Dict[int, list]] = None  # collected for the results cache
+    total_matches: int = 0
+    pages_with_matches: int = 0
+    first_page: Optional[int] = None
+    last_page: Optional[int] = None  # last page whose hits were collected
+
+
 # ---------------------------------------------------------------------------
 # RedactionModel — document state + pending redactions
 # ---------------------------------------------------------------------------
@@ -90,6 +148,15 @@ class RedactionModel:
         self.file_path: Optional[str] = None
         self.current_page: int = 0
         self.pending: Dict[int, List[RedactionRect]] = {}  # page_num -> [rects]
+        self._by_id: Dict[str, RedactionRect] = {}  # id -> rect, mirrors pending
+        # (page_num, ASCII-folded text) -> hits, valid until the document changes
+        self._search_cache: OrderedDict[Tuple[int, str], list] = OrderedDict()
+        # page_num -> (page, its parsed TextPage), reused by search_for
+        self._textpages = ClockCache(TEXTPAGE_CACHE_LIMIT)
+        # page_num -> normalized page text, filled by a background thread
+        self._page_text: Dict[int, str] = {}
+        self._index_stop = threading.Event()
+        self._index_thread: Optional[threading.Thread] = None
         self.is_applied: bool = False
 
     # -- Document lifecycle ---------------------------------------------------
@@ -100,17 +167,70 @@ class RedactionModel:
         self.file_path = path
         self.current_page = 0
         self.pending = {}
+        self._by_id = {}
+        self._search_cache.clear()
         self.is_applied = False
+        self._start_indexing()
 
     def close_document(self) -> None:
+        self._stop_indexing()
+        self._page_text = {}
+        self._textpages.clear()  # release MuPDF text structures before close
         if self.doc:
             self.doc.close()
         self.doc = None
         self.file_path = None
         self.current_page = 0
         self.pending = {}
+        self._by_id = {}
+        self._search_cache.clear()
         self.is_applied = False
 
+    # -- Text index -----------------------------------------------------------
+
+    @staticmethod
+    def _normalize_for_index(text: str) -> str:
+        """Applied alike to page text and queries before the prefilter test.
+
+        casefold() merges at least every pair of characters search_for
+        treats as equal, so the prefilter can only err towards searching.
+        """
+        return INDEX_STRIP_RE.sub("", text).casefold()
+
+    def _start_indexing(self) -> None:
+        """Extract the text of pages not yet indexed on a background thread.
+
+        The text is only used to skip pages that cannot match a query;
+        actual hits always come from page.search_for.
+        """
+        self._index_stop = threading.Event()
+        self._index_thread = threading.Thread(
+            target=self._build_index,
+            args=(self.doc, self._page_text, self._index_stop),
+            daemon=True,
+        )
+        self._index_thread.start()
+
+    def _build_index(self, doc: fitz.Document, page_text: Dict[int, str],
+                     stop: threading.Event) -> None:
+        for i in range(len(doc)):
+            if stop.is_set():
+                return
+            if i in page_text:
+                continue
+            text = doc[i].get_text("text", flags=SEARCH_TEXT_FLAGS)
+            page_text[i] = self._normalize_for_index(text)
+
+    def _stop_indexing(self) -> None:
+        """Stop the index thread; waits for at most one page extraction.
+
+        Call before the document is modified. Text indexed so far is kept.
+        """
+        self._index_stop.set()
+        if self._index_thread is not None:
+            self._index_thread.join()
+            self._index_thread = None
+
     @property
     def page_count(self) -> int:
         return len(self.doc) if self.doc else 0
@@ -123,16 +243,28 @@ class RedactionModel:
     def add_redaction(self, redaction: RedactionRect) -> None:
         page_list = self.pending.setdefault(redaction.page_num, [])
         page_list.append(redaction)
+        self._by_id[redaction.id] = redaction
+
+    def add_redactions(self, redactions: List[RedactionRect]) -> None:
+        """Add many redactions at once, e.g. all search hits on a page."""
+        by_id = self._by_id
+        pending = self.pending
+        for r in redactions:
+            pending.setdefault(r.page_num, []).append(r)
+            by_id[r.id] = r
 
     def remove_redaction(self, redaction_id: str) -> Optional[RedactionRect]:
-        for page_num, rects in self.pending.items():
-            for r in rects:
-                if r.id == redaction_id:
-                    rects.remove(r)
-                    if not rects:
-                        del self.pending[page_num]
-                    return r
-        return None
+        r = self._by_id.pop(redaction_id, None)
+        if r is None:
+            return None
+        rects = self.pending[r.page_num]
+        rects.remove(r)
+        if not rects:
+            del self.pending[r.page_num]
+        return r
+
+    def get_redaction(self, redaction_id: str) -> Optional[RedactionRect]:
+        return self._by_id.get(redaction_id)
 
     def get_page_redactions(self, page_num: int) -> List[RedactionRect]:
         return self.pending.get(page_num, [])
@@ -144,55 +276,204 @@ class RedactionModel:
         return result
 
     def redaction_count(self) -> int:
-        return sum(len(v) for v in self.pending.values())
+        return len(self._by_id)
 
     def has_pending(self) -> bool:
-        return self.redaction_count() > 0
+        return bool(self._by_id)
 
     def clear_page_redactions(self, page_num: int) -> int:
-        removed = len(self.pending.get(page_num, []))
-        self.pending.pop(page_num, None)
-        return removed
+        rects = self.pending.pop(page_num, [])
+        for r in rects:
+            del self._by_id[r.id]
+        return len(rects)
 
     def clear_all_redactions(self) -> int:
         count = self.redaction_count()
         self.pending.clear()
+        self._by_id.clear()
         return count
 
     # -- Search ---------------------------------------------------------------
 
-    def search_text(self, text: str) -> Dict[int, list]:
-        """Search all pages for text. Returns {page_num: [fitz.Rect]}."""
+    def iter_search(self, text: str,
+                    start_page: int = 0) -> Iterator[Tuple[int, list]]:
+        """Search pages one at a time. Yields (page_num, [fitz.Quad]).
+
+        Every scanned page is yielded, with an empty list when it has no
+        hits, so callers can pause or stop between pages. Pages already in
+        the text index whose text cannot contain the query are skipped
+        without calling MuPDF.
+        """
         fitz.TOOLS.set_small_glyph_heights(True)
-        results: Dict[int, list] = {}
-        for i in range(self.page_count):
-            page = self.doc[i]
-            hits = page.search_for(text, quads=True)
-            if hits:
-                results[i] = hits
-        return results
+        cache = self._search_cache
+        page_text = self._page_text
+        # Folded once per query; search_for ignores ASCII case only, so "SSN"
+        # and "ssn" share cache entries but "ÉLAN" and "élan" do not
+        folded = text.translate(SEARCH_CASE_FOLD)
+        needle = self._normalize_for_index(text)
+        for i in range(start_page, self.page_count):
+            indexed = page_text.get(i)
+            if indexed is not None and needle not in indexed:
+                yield i, []
+                continue
+            key = (i, folded)
+            hits = cache.get(key)
+            if hits is None:
+                page, textpage = self._get_textpage(i)
+                hits = page.search_for(text, quads=True, textpage=textpage)
+                cache[key] = hits
+                if len(cache) > SEARCH_CACHE_LIMIT:
+                    cache.popitem(last=False)
+            else:
+                cache.move_to_end(key)
+            yield i, hits
+
+    def _get_textpage(self, page_num: int) -> Tuple[fitz.Page, fitz.TextPage]:
+        """Parse a page's text once and reuse it for every query.
+
+        search_for requires the TextPage's own Page object, so both are kept.
+        """
+        entry = self._textpages.get(page_num)
+        if entry is None:
+            page = self.doc[page_num]
+            # Same flags search_for would use, so a cached TextPage
+            # returns exactly the hits an uncached search does
+            entry = (page, page.get_textpage(flags=SEARCH_TEXT_FLAGS))
+            self._textpages.put(page_num, entry)
+        return entry
+
+    def search_text(self, text: str) -> Dict[int, list]:
+        """Search all pages for text. Returns {page_num: [fitz.Quad]}."""
+        return {i: hits for i, hits in self.iter_search(text) if hits}
 
     # -- Apply & Save ---------------------------------------------------------
 
-    def apply_redactions(self) -> int:
-        """Apply all pending redactions. Returns count applied. IRREVERSIBLE."""
+    def apply_redactions(self) -> Tuple[int, Set[int]]:
+        """Apply all pending redactions. IRREVERSIBLE.
+
+        Returns (count applied, set of page numbers that were modified).
+        """
+        Rect = fitz.Rect
+        groups = [(page_num, [Rect(r.pdf_rect) for r in rects])
+                  for page_num, rects in self.pending.items()]
+        affected_pages = set(self.pending)
         count = 0
-        for page_num, rects in self.pending.items():
-            page = self.doc[page_num]
-            for r in rects:
-                fitz_rect = fitz.Rect(r.pdf_rect)
-                page.add_redact_annot(fitz_rect, fill=APPLIED_FILL_RGB)
-                count += 1
-            page.apply_redactions(images=fitz.PDF_REDACT_IMAGE_PIXELS,
-                                  graphics=fitz.PDF_REDACT_LINE_ART_REMOVE_IF_TOUCHED)
+        self._stop_indexing()  # no extraction while pages are rewritten
+        try:
+            for page_num, fitz_rects in groups:
+                page = self.doc[page_num]
+                images = self._image_redact_mode(page, fitz_rects)
+                add_annot = page.add_redact_annot
+                for fitz_rect in fitz_rects:
+                    add_annot(fitz_rect, fill=APPLIED_FILL_RGB)
+                count += len(fitz_rects)
+                page.apply_redactions(images=images,
+                                      graphics=fitz.PDF_REDACT_LINE_ART_REMOVE_IF_TOUCHED)
+        finally:
+            # Even after a failure any of these pages may have changed
+            for page_num in affected_pages:
+                self._page_text.pop(page_num, None)
+            self._textpages.discard_where(lambda k: k in affected_pages)
+            self._search_cache.clear()
+            self._start_indexing()  # re-extracts just the dropped pages
         self.pending.clear()
+        self._by_id.clear()
         self.is_applied = True
-        return count
+        return count, affected_pages
+
+    @staticmethod
+    def _image_redact_mode(page: fitz.Page, rects: List[fitz.Rect]) -> int:
+        """Only re-encode images when a redaction actually overlaps one."""
+        for info in page.get_image_info():
+            bbox = fitz.Rect(info["bbox"])
+            if any(bbox.intersects(r) for r in rects):
+                return fitz.PDF_REDACT_IMAGE_PIXELS
+        return fitz.PDF_REDACT_IMAGE_NONE
 
     def save_document(self, path: str) -> None:
         """Save with scrub + garbage collection for true data removal."""
-        self.doc.scrub()
-        self.doc.save(path, garbage=3, deflate=True)
+        self._stop_indexing()
+        try:
+            self.doc.scrub()
+        finally:
+            # scrub() rewrites page content (hidden text, links), so hits
+            # and parsed text from before it may no longer exist
+            self._textpages.clear()
+            self._search_cache.clear()
+            self._page_text.clear()
+        try:
+            self.doc.save(path, garbage=3, deflate=True)
+        finally:
+            self._start_indexing()
+
+
+# ---------------------------------------------------------------------------
+# ClockCache — bounded cache with second-chance eviction
+# ---------------------------------------------------------------------------
+
+class ClockCache:
+    """Fixed-size cache evicted with the clock (second-chance) policy.
+
+    A hit only sets the entry's reference bit. On insert into a full cache
+    the hand sweeps the ring, clearing set bits, and evicts the first entry
+    whose bit is already clear.
+    """
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self._entries: Dict[Hashable, list] = {}  # key -> [value, ref_bit]
+        self._ring: Deque[Hashable] = deque()  # ring[0] is under the hand
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        entry[1] = True
+        return entry[0]
+
+    def put(self, key: Hashable, value: Any) -> Any:
+        """Store value under key. Returns the evicted value, if any."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            entry[0] = value
+            entry[1] = True
+            return None
+        evicted = None
+        if len(self._entries) >= self.limit:
+            evicted = self._evict()
+        self._entries[key] = [value, False]
+        self._ring.append(key)
+        return evicted
+
+    def _evict(self) -> Any:
+        ring = self._ring
+        while True:
+            entry = self._entries[ring[0]]
+            if entry[1]:
+                entry[1] = False
+                ring.rotate(-1)
+            else:
+                del self._entries[ring.popleft()]
+                return entry[0]
+
+    def discard_where(self, predicate: Callable[[Hashable], bool]) -> List[Any]:
+        """Remove every entry whose key matches predicate; return their values."""
+        doomed = [k for k in self._entries if predicate(k)]
+        if not doomed:
+            return []
+        removed = [self._entries.pop(key)[0] for key in doomed]
+        self._ring = deque(k for k in self._ring if k in self._entries)
+        return removed
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._ring.clear()
 
 
 # ---------------------------------------------------------------------------
@@ -200,35 +481,187 @@ class RedactionModel:
 # ---------------------------------------------------------------------------
 
 class PDFRenderer:
-    """Renders PDF pages to PIL Images with an LRU cache."""
+    """Renders PDF pages to PIL Images with a clock-evicted cache.
+
+    Pages are rasterized by MuPDF directly at the display zoom, so no
+    second resampling pass is needed before they reach the canvas.
+    Cache misses can be rendered on a worker thread, and neighboring pages
+    prefetched on another, so the Tk event loop is not blocked by MuPDF.
+    """
 
     def __init__(self):
-        self._cache: OrderedDict[int, Image.Image] = OrderedDict()
+        # (page_num, zoom) -> rendered page; shared with the prefetch worker
+        self._pil_cache = ClockCache(CACHE_LIMIT)
+        # (page_num, zoom) -> same page as a Tk image ready for the canvas
+        self._cache = ClockCache(PHOTO_CACHE_LIMIT)
+        # Last Tk image evicted from _cache, recycled for the next miss
+        self._spare_photo: Optional[ImageTk.PhotoImage] = None
+
+        self._lock = threading.Lock()  # guards _pil_cache and _generation
+        self._render_lock = threading.Lock()  # one rasterization at a time
+        self._generation = 0  # bumped to discard queued prefetches
+        self._render_exec = ThreadPoolExecutor(max_workers=1)
+        self._prefetch_exec = ThreadPoolExecutor(max_workers=1)
 
-    def render_page(self, page: fitz.Page, page_num: int) -> Image.Image:
-        """Render a page at RENDER_DPI. Returns a PIL Image."""
-        if page_num in self._cache:
-            self._cache.move_to_end(page_num)
-            return self._cache[page_num]
+    @staticmethod
+    def zoom_for_width(page: fitz.Page, target_width_px: int) -> float:
+        """Pixels per PDF point that fit the page into target_width_px.
 
-        pix = page.get_pixmap(dpi=RENDER_DPI)
-        img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
+        Capped at RENDER_DPI, so very wide canvases show the page at that
+        resolution rather than rendering ever larger pixmaps. Rounded so
+        that small debounced resizes land on the same cache key.
+        """
+        zoom = min(target_width_px / page.rect.width, RENDER_SCALE)
+        return round(zoom, 2)
 
-        self._cache[page_num] = img
-        if len(self._cache) > CACHE_LIMIT:
-            self._cache.popitem(last=False)
+    @staticmethod
+    def _rasterize(page: fitz.Page, zoom: float) -> Image.Image:
+        pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), alpha=False)
+        # samples_mv views the pixmap memory directly; pix.samples would first
+        # copy it into a bytes object. PIL unpacks RGB into its own 4-byte
+        # layout, so the image does not keep a reference to pix.
+        return Image.frombuffer("RGB", (pix.width, pix.height), pix.samples_mv,
+                                "raw", "RGB", pix.stride, 1)
+
+    def _get(self, key: Tuple[int, float]) -> Optional[Image.Image]:
+        with self._lock:
+            return self._pil_cache.get(key)
+
+    def _put(self, key: Tuple[int, float], img: Image.Image,
+             generation: Optional[int] = None) -> None:
+        """Store a render, unless it was started before the last invalidate."""
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            self._pil_cache.put(key, img)
+
+    def render_page(self, page: fitz.Page, page_num: int,
+                    target_width_px: int) -> Image.Image:
+        """Render a page scaled to target_width_px. Returns a PIL Image."""
+        key = (page_num, self.zoom_for_width(page, target_width_px))
+        img = self._get(key)
+        if img is not None:
+            return img
+
+        with self._lock:
+            generation = self._generation
+        with self._render_lock:
+            # Another worker may have finished this page while we waited
+            img = self._get(key)
+            if img is None:
+                img = self._rasterize(page, key[1])
+                self._put(key, img, generation)
+        return img
 
+    def render_page_async(self, page: fitz.Page, page_num: int,
+                          target_width_px: int) -> "Future[Optional[Image.Image]]":
+        """Run render_page on the render worker thread.
+
+        The future resolves to None if the renderer was invalidated before
+        the job started, since the page may belong to a changed document.
+        """
+        with self._lock:
+            generation = self._generation
+        return self._render_exec.submit(self._render_task, page, page_num,
+                                        target_width_px, generation)
+
+    def _render_task(self, page: fitz.Page, page_num: int, target_width_px: int,
+                     generation: int) -> Optional[Image.Image]:
+        # Checked while holding _render_lock, so once cancel_pending has
+        # waited on that lock no stale job can touch the document
+        with self._render_lock:
+            with self._lock:
+                if generation != self._generation:
+                    return None
+            key = (page_num, self.zoom_for_width(page, target_width_px))
+            img = self._get(key)
+            if img is None:
+                img = self._rasterize(page, key[1])
+                self._put(key, img, generation)
         return img
 
-    def invalidate(self, page_num: Optional[int] = None) -> None:
-        if page_num is not None:
-            self._cache.pop(page_num, None)
+    def is_cached(self, page: fitz.Page, page_num: int,
+                  target_width_px: int) -> bool:
+        """True if the page can be displayed without rasterizing."""
+        key = (page_num, self.zoom_for_width(page, target_width_px))
+        if key in self._cache:
+            return True
+        with self._lock:
+            return key in self._pil_cache
+
+    def prefetch(self, page: fitz.Page, page_num: int,
+                 target_width_px: int) -> None:
+        """Queue a background render of a page unless it is already cached."""
+        key = (page_num, self.zoom_for_width(page, target_width_px))
+        with self._lock:
+            if key in self._pil_cache:
+                return
+            generation = self._generation
+        self._prefetch_exec.submit(self._prefetch_task, page, key, generation)
+
+    def _prefetch_task(self, page: fitz.Page, key: Tuple[int, float],
+                       generation: int) -> None:
+        with self._render_lock:
+            with self._lock:
+                if generation != self._generation or key in self._pil_cache:
+                    return
+            self._put(key, self._rasterize(page, key[1]), generation)
+
+    def cancel_pending(self) -> None:
+        """Drop queued prefetches and wait out any render in progress.
+
+        Call before the document is modified or closed.
+        """
+        with self._lock:
+            self._generation += 1
+        with self._render_lock:
+            pass
+
+    def shutdown(self) -> None:
+        self.cancel_pending()
+        self._render_exec.shutdown(wait=False)
+        self._prefetch_exec.shutdown(wait=False)
+
+    def get_display_photo(self, page: fitz.Page, page_num: int,
+                          target_width_px: int) -> ImageTk.PhotoImage:
+        """Return the page at target_width_px as a Tk image, reusing earlier ones."""
+        key = (page_num, self.zoom_for_width(page, target_width_px))
+        photo = self._cache.get(key)
+        if photo is not None:
+            return photo
+
+        img = self.render_page(page, page_num, target_width_px)
+        spare = self._spare_photo
+        if spare is not None and (spare.width(), spare.height()) == img.size:
+            # Blit into the existing Tk image instead of allocating a new one
+            spare.paste(img)
+            photo = spare
+            self._spare_photo = None
         else:
-            self._cache.clear()
-
-    @staticmethod
-    def render_scale() -> float:
-        return RENDER_DPI / 72.0
+            photo = ImageTk.PhotoImage(img)
+
+        evicted = self._cache.put(key, photo)
+        if evicted is not None:
+            self._spare_photo = evicted
+
+        return photo
+
+    def invalidate(self, pages: Optional[Iterable[int]] = None) -> None:
+        """Drop cached renders of the given pages, or of every page."""
+        with self._lock:
+            self._generation += 1
+            if pages is not None:
+                pages = set(pages)
+                self._pil_cache.discard_where(lambda k: k[0] in pages)
+                stale = self._cache.discard_where(lambda k: k[0] in pages)
+                if stale:
+                    # The re-render of an edited page has the same size, so
+                    # its old Tk image can be pasted into rather than freed
+                    self._spare_photo = stale[-1]
+            else:
+                self._pil_cache.clear()
+                self._cache.clear()
+                self._spare_photo = None
 
 
 # ---------------------------------------------------------------------------
@@ -243,19 +676,29 @@ class CanvasController:
         self.canvas = canvas
         self.model = model
         self.renderer = renderer
-        self.on_change = on_change  # callback when redactions change
+        # Callback when redactions change; called with added= or removed_id=
+        # for a single edit, or with no arguments for anything larger
+        self.on_change = on_change
 
         self._total_scale: float = 1.0
+        self._inv_total_scale: float = 1.0  # canvas px -> PDF points
         self._drawing: bool = False
         self._draw_start: Optional[Tuple[float, float]] = None
         self._temp_rect_id: Optional[int] = None
+        self._coords = self.canvas.coords  # bound once for the drag hot path
+        self._pending_drag: Optional[Tuple[float, float]] = None
+        self._drag_job = None
         self._photo: Optional[ImageTk.PhotoImage] = None  # prevent GC
-        self._pil_image: Optional[Image.Image] = None
+        self._display_token: int = 0  # identifies the latest display request
 
-        # Maps canvas item id -> redaction id
-        self._canvas_to_rid: Dict[int, str] = {}
+        # Maps redaction id -> canvas item id
         self._rid_to_canvas: Dict[str, int] = {}
         self._selected_rid: Optional[str] = None
+        self._overlay_page: Optional[int] = None  # page the overlays belong to
+
+        # Spatial grid for hit testing, in PDF points so zooming leaves it valid
+        self._grid: DefaultDict[Tuple[int, int], Set[str]] = defaultdict(set)
+        self._rid_rects: Dict[str, Tuple[float, float, float, float]] = {}
 
         self._bind_events()
 
@@ -274,9 +717,8 @@ class CanvasController:
         return self.canvas.canvasx(event.x), self.canvas.canvasy(event.y)
 
     def canvas_to_pdf(self, cx: float, cy: float) -> Tuple[float, float]:
-        if self._total_scale == 0:
-            return 0.0, 0.0
-        return cx / self._total_scale, cy / self._total_scale
+        inv = self._inv_total_scale
+        return cx * inv, cy * inv
 
     def pdf_to_canvas(self, px: float, py: float) -> Tuple[float, float]:
         return px * self._total_scale, py * self._total_scale
@@ -292,13 +734,25 @@ class CanvasController:
             outline=TEMP_OUTLINE, width=2, dash=TEMP_DASH,
             tags=("temp_drawing",)
         )
+        self._pending_drag = None
 
     def _on_drag(self, event) -> None:
+        """Record the latest pointer position; the redraw waits for idle."""
         if not self._drawing or self._temp_rect_id is None:
             return
-        cx, cy = self._event_coords(event)
+        self._pending_drag = self._event_coords(event)
+        if self._drag_job is None:
+            self._drag_job = self.canvas.after_idle(self._flush_drag)
+
+    def _flush_drag(self) -> None:
+        """Apply only the newest of the motion events since the last frame."""
+        self._drag_job = None
+        if self._pending_drag is None or self._temp_rect_id is None:
+            return
+        cx, cy = self._pending_drag
+        self._pending_drag = None
         x0, y0 = self._draw_start
-        self.canvas.coords(self._temp_rect_id, x0, y0, cx, cy)
+        self._coords(self._temp_rect_id, x0, y0, cx, cy)
 
     def _on_release(self, event) -> None:
         if not self._drawing:
@@ -309,6 +763,10 @@ class CanvasController:
         x0, y0 = self._draw_start
 
         # Clean up temp rectangle
+        if self._drag_job is not None:
+            self.canvas.after_cancel(self._drag_job)
+            self._drag_job = None
+        self._pending_drag = None
         if self._temp_rect_id is not None:
             self.canvas.delete(self._temp_rect_id)
             self._temp_rect_id = None
@@ -335,19 +793,37 @@ class CanvasController:
 
         # Draw permanent overlay
         self._draw_overlay(redaction)
-        self.on_change()
+        self.on_change(added=redaction)
 
     def _on_right_click(self, event) -> None:
         """Right-click to remove a redaction rectangle."""
-        cx, cy = self._event_coords(event)
-        items = self.canvas.find_overlapping(cx - 3, cy - 3, cx + 3, cy + 3)
-        for item in items:
-            if item in self._canvas_to_rid:
-                rid = self._canvas_to_rid[item]
-                self._remove_overlay(rid)
-                self.model.remove_redaction(rid)
-                self.on_change()
-                return
+        px, py = self.canvas_to_pdf(*self._event_coords(event))
+        rid = self._hit_test(px, py, HIT_TOLERANCE * self._inv_total_scale)
+        if rid is not None:
+            self._remove_overlay(rid)
+            self.model.remove_redaction(rid)
+            self.on_change(removed_id=rid)
+
+    def _hit_test(self, px: float, py: float, tol: float) -> Optional[str]:
+        """Return the topmost overlay within tol PDF points of (px, py)."""
+        candidates: Set[str] = set()
+        for cell in self._grid_cells(px - tol, py - tol, px + tol, py + tol):
+            candidates.update(self._grid.get(cell, ()))
+        best = None
+        for rid in candidates:
+            x0, y0, x1, y1 = self._rid_rects[rid]
+            if x0 - tol <= px <= x1 + tol and y0 - tol <= py <= y1 + tol:
+                if best is None or self._rid_to_canvas[rid] > self._rid_to_canvas[best]:
+                    best = rid
+        return best
+
+    @staticmethod
+    def _grid_cells(x0: float, y0: float, x1: float,
+                    y1: float) -> Iterator[Tuple[int, int]]:
+        """Grid cells covered by a rectangle in PDF points."""
+        for gx in range(int(x0 // HIT_GRID_CELL), int(x1 // HIT_GRID_CELL) + 1):
+            for gy in range(int(y0 // HIT_GRID_CELL), int(y1 // HIT_GRID_CELL) + 1):
+                yield gx, gy
 
     # -- Overlay drawing ------------------------------------------------------
 
@@ -362,84 +838,157 @@ class CanvasController:
             outline=REDACT_OUTLINE, width=REDACT_OUTLINE_WIDTH,
             tags=("redaction", f"rid_{redaction.id}"),
         )
-        self._canvas_to_rid[item_id] = redaction.id
         self._rid_to_canvas[redaction.id] = item_id
+
+        rx0, ry0, rx1, ry1 = redaction.pdf_rect
+        rect = (min(rx0, rx1), min(ry0, ry1), max(rx0, rx1), max(ry0, ry1))
+        self._rid_rects[redaction.id] = rect
+        for cell in self._grid_cells(*rect):
+            self._grid[cell].add(redaction.id)
         return item_id
 
     def _remove_overlay(self, redaction_id: str) -> None:
         item_id = self._rid_to_canvas.pop(redaction_id, None)
         if item_id is not None:
-            self._canvas_to_rid.pop(item_id, None)
             self.canvas.delete(item_id)
-
-    def draw_all_overlays(self, page_num: int) -> None:
-        """Draw overlays for all pending redactions on the given page."""
-        for r in self.model.get_page_redactions(page_num):
-            self._draw_overlay(r)
+        rect = self._rid_rects.pop(redaction_id, None)
+        if rect is not None:
+            for cell in self._grid_cells(*rect):
+                rids = self._grid[cell]
+                rids.discard(redaction_id)
+                if not rids:
+                    del self._grid[cell]
 
     def clear_overlays(self) -> None:
         """Remove all overlay rectangles from the canvas."""
         self.canvas.delete("redaction")
-        self._canvas_to_rid.clear()
         self._rid_to_canvas.clear()
+        self._grid.clear()
+        self._rid_rects.clear()
         self._selected_rid = None
+        self._overlay_page = None
 
     def select_redaction(self, redaction_id: str) -> None:
         """Highlight a specific redaction on the canvas."""
         self.deselect_all()
         item_id = self._rid_to_canvas.get(redaction_id)
         if item_id:
+            self.canvas.addtag_withtag("selected", item_id)
             self.canvas.itemconfigure(item_id, outline=SELECTED_OUTLINE,
                                       width=SELECTED_OUTLINE_WIDTH)
             self._selected_rid = redaction_id
 
     def deselect_all(self) -> None:
-        if self._selected_rid:
-            item_id = self._rid_to_canvas.get(self._selected_rid)
-            if item_id:
-                self.canvas.itemconfigure(item_id, outline=REDACT_OUTLINE,
-                                          width=REDACT_OUTLINE_WIDTH)
+        # Tag-based so one Tk call resets however many items are selected
+        self.canvas.itemconfigure("selected", outline=REDACT_OUTLINE,
+                                  width=REDACT_OUTLINE_WIDTH)
+        self.canvas.dtag("selected", "selected")
         self._selected_rid = None
 
     # -- Page display ---------------------------------------------------------
 
+    def fit_width(self) -> int:
+        """Display width that fits a page to the canvas."""
+        return max(self.canvas.winfo_width() - 20, 400)
+
     def display_page(self, page_num: int, fit_width: Optional[int] = None) -> None:
-        """Render and display a page, including all redaction overlays."""
+        """Display a page, including all redaction overlays.
+
+        Overlays are placed immediately. If the page image is not cached it
+        is rendered on the worker thread behind a placeholder.
+        """
         if not self.model.doc:
             return
 
         page = self.model.get_page(page_num)
-        pil_image = self.renderer.render_page(page, page_num)
-        self._pil_image = pil_image
-
-        # Calculate scale to fit canvas width
         if fit_width is None:
-            fit_width = max(self.canvas.winfo_width() - 20, 400)
-
-        display_scale = fit_width / pil_image.width
-        render_scale = PDFRenderer.render_scale()
-        self._total_scale = render_scale * display_scale
-
-        # Scale image for display
-        new_w = int(pil_image.width * display_scale)
-        new_h = int(pil_image.height * display_scale)
-        display_img = pil_image.resize((new_w, new_h), Image.LANCZOS)
+            fit_width = self.fit_width()
+
+        if page_num != self._overlay_page:
+            # One tagged delete, rather than rescaling and then diffing
+            # away every overlay of the previous page
+            self.clear_overlays()
+            self._overlay_page = page_num
+        self._set_scale(PDFRenderer.zoom_for_width(page, fit_width))
+        self.sync_overlays(page_num)
+
+        self._display_token += 1
+        if self.renderer.is_cached(page, page_num, fit_width):
+            self._render_image_layer(page, page_num, fit_width)
+            return
 
+        self._show_placeholder(page)
+        token = self._display_token
+        future = self.renderer.render_page_async(page, page_num, fit_width)
+        future.add_done_callback(
+            lambda f: self.canvas.after(0, self._on_render_done,
+                                        f, token, page_num, fit_width))
+
+    def _on_render_done(self, future: Future, token: int, page_num: int,
+                        fit_width: int) -> None:
+        """Back on the Tk thread: show the result unless it is stale."""
+        if token != self._display_token or not self.model.doc:
+            return
+        error = future.exception()
+        if error is not None:
+            self.canvas.itemconfigure("placeholder_text",
+                                      text=f"Could not render page:\n{error}")
+            return
+        if future.result() is None:
+            return
+        page = self.model.get_page(page_num)
+        self._render_image_layer(page, page_num, fit_width)
+
+    def _set_scale(self, scale: float) -> None:
+        """Switch to a new zoom, rescaling existing overlays to match."""
+        if self._rid_to_canvas and scale != self._total_scale:
+            factor = scale / self._total_scale
+            self.canvas.scale("redaction", 0, 0, factor, factor)
+        self._total_scale = scale
+        self._inv_total_scale = 1.0 / scale if scale else 0.0
+
+    def _show_placeholder(self, page: fitz.Page) -> None:
+        """Blank page-sized stand-in shown while the render is in flight."""
+        w = page.rect.width * self._total_scale
+        h = page.rect.height * self._total_scale
+        self.canvas.delete("page_image", "placeholder")
+        self.canvas.create_rectangle(0, 0, w, h, fill="white", outline="",
+                                     tags=("placeholder",))
+        self.canvas.create_text(w / 2, h / 3, text="Rendering…", fill="gray",
+                                tags=("placeholder", "placeholder_text"))
+        self.canvas.tag_lower("placeholder")
+        self.canvas.config(scrollregion=(0, 0, w, h))
+
+    def _render_image_layer(self, page: fitz.Page, page_num: int,
+                            fit_width: int) -> None:
+        """Replace the page image (or placeholder) on the canvas."""
         # Keep reference to prevent garbage collection
-        self._photo = ImageTk.PhotoImage(display_img)
-
-        # Update canvas
-        self.canvas.delete("all")
-        self._canvas_to_rid.clear()
-        self._rid_to_canvas.clear()
-        self._selected_rid = None
+        self._photo = self.renderer.get_display_photo(page, page_num, fit_width)
+        new_w, new_h = self._photo.width(), self._photo.height()
 
+        self.canvas.delete("page_image", "placeholder")
         self.canvas.create_image(0, 0, anchor="nw", image=self._photo,
                                  tags=("page_image",))
+        self.canvas.tag_lower("page_image")
         self.canvas.config(scrollregion=(0, 0, new_w, new_h))
 
-        # Draw redaction overlays for this page
-        self.draw_all_overlays(page_num)
+    def sync_overlays(self, page_num: int) -> None:
+        """Make the canvas overlays match the page's pending redactions.
+
+        Only overlays that were added or removed since the last sync are
+        created or deleted; the rest are left in place.
+        """
+        if page_num != self._overlay_page:
+            self.clear_overlays()
+            self._overlay_page = page_num
+        wanted = {r.id: r for r in self.model.get_page_redactions(page_num)}
+        for rid in [rid for rid in self._rid_to_canvas if rid not in wanted]:
+            self._remove_overlay(rid)
+        for rid, r in wanted.items():
+            if rid not in self._rid_to_canvas:
+                self._draw_overlay(r)
+        if self._selected_rid not in self._rid_to_canvas:
+            self._selected_rid = None
 
 
 # ---------------------------------------------------------------------------
@@ -473,8 +1022,30 @@ class RedactorApp:
 
         # Resize debounce
         self._resize_job = None
+        self._canvas_width: Optional[int] = None
+
+        # Background search state; callbacks carrying an old token are stale
+        self._search_token = 0
+        self._search_run: Optional[SearchRun] = None
+        self._search_thread: Optional[threading.Thread] = None
+        self._search_stop = threading.Event()
+        self._search_queue: "queue.Queue[tuple]" = queue.Queue()
+        self._search_poll_job = None
+        # (id(doc), ASCII-folded text) -> {page_num: quads} of completed searches
+        self._search_cache: OrderedDict[Tuple[int, str],
+                                        Dict[int, list]] = OrderedDict()
+        self._prefetch_job = None
         self.canvas.bind("<Configure>", self._on_canvas_configure)
 
+        # Mouse-wheel coalescing
+        self._wheel_accum = 0
+        self._wheel_job = None
+
+        # Modeless "Apply Redactions" confirmation, while it is open
+        self._confirm_dialog: Optional[tk.Toplevel] = None
+        self._confirm_label: Optional[ttk.Label] = None
+        self._confirm_yes_btn: Optional[ttk.Button] = None
+
         # Keyboard shortcuts
         self.root.bind("<Command-o>", lambda e: self._on_open())
         self.root.bind("<Command-s>", lambda e: self._on_save())
@@ -591,6 +1162,10 @@ class RedactorApp:
 
         ttk.Button(search_row, text="Find All",
                     command=self._on_search, width=8).pack(side="right")
+        self.search_cancel_btn = ttk.Button(search_row, text="Cancel",
+                                            command=self._on_search_cancel,
+                                            width=6, state="disabled")
+        self.search_cancel_btn.pack(side="right", padx=(0, 3))
 
         self.search_status = ttk.Label(search_frame, text="", foreground="gray")
         self.search_status.pack(fill="x", pady=(4, 0))
@@ -620,6 +1195,8 @@ class RedactorApp:
         tree_scroll.pack(side="right", fill="y")
 
         self.tree.bind("<<TreeviewSelect>>", self._on_tree_select)
+        self._tree_ids: Set[str] = set()  # iids currently in the treeview
+        self._list_update_pending = False
 
         # Buttons under the treeview
         btn_frame = ttk.Frame(sidebar)
@@ -667,16 +1244,27 @@ class RedactorApp:
 
         state_doc = "normal" if has_doc else "disabled"
         state_pending = "normal" if (has_doc and has_pending) else "disabled"
+        # Applying mid-search would leave matches on unscanned pages
+        searching = self._search_run is not None
+        state_apply = "disabled" if searching else state_pending
 
         self.save_btn.config(state=state_doc)
         self.prev_btn.config(state=state_doc)
         self.next_btn.config(state=state_doc)
         self.search_entry.config(state=state_doc)
-        self.apply_btn.config(state=state_pending)
+        self.apply_btn.config(state=state_apply)
         self.remove_btn.config(state=state_pending)
         self.clear_page_btn.config(state=state_pending)
         self.clear_all_btn.config(state=state_pending)
 
+        if self._confirm_dialog is not None:
+            # The dialog is modeless, so edits can land while it is open
+            if has_doc and has_pending:
+                self._confirm_label.config(text=self._apply_prompt())
+                self._confirm_yes_btn.config(state=state_apply)
+            else:
+                self._dismiss_confirm()
+
         if has_doc:
             p = self.model.current_page
             n = self.model.page_count
@@ -697,19 +1285,83 @@ class RedactorApp:
             return
         self.controller.display_page(self.model.current_page)
         self._update_ui_state()
+        self._schedule_prefetch()
 
-    def _update_redaction_list(self) -> None:
-        """Rebuild the treeview with all pending redactions."""
-        self.tree.delete(*self.tree.get_children())
-        for r in self.model.all_redactions():
-            self.tree.insert("", "end", iid=r.id,
-                             values=(r.page_num + 1, r.source.capitalize(),
-                                     r.description))
-        self._update_ui_state()
+    def _schedule_prefetch(self) -> None:
+        """Warm the renderer cache with the neighbors of the current page."""
+        if self._prefetch_job:
+            self.root.after_cancel(self._prefetch_job)
+        self._prefetch_job = self.root.after(PREFETCH_DELAY_MS,
+                                             self._prefetch_neighbors)
 
-    def _on_redaction_change(self) -> None:
-        """Called whenever redactions are added or removed."""
-        self._update_redaction_list()
+    def _prefetch_neighbors(self) -> None:
+        self._prefetch_job = None
+        if not self.model.doc:
+            return
+        width = self.controller.fit_width()
+        for page_num in (self.model.current_page - 1, self.model.current_page + 1):
+            if 0 <= page_num < self.model.page_count:
+                self.renderer.prefetch(self.model.get_page(page_num), page_num, width)
+
+    @contextmanager
+    def _batch_tree_update(self):
+        """Hide the treeview columns during bulk edits.
+
+        With no columns displayed Tk skips measuring each inserted row, so
+        the layout happens once when the columns are restored.
+        """
+        displaycolumns = self.tree.cget("displaycolumns")
+        self.tree.configure(displaycolumns=())
+        try:
+            yield
+        finally:
+            self.tree.configure(displaycolumns=displaycolumns)
+
+    def _schedule_redaction_list_update(self) -> None:
+        """Rebuild the treeview once idle, so status text can paint first.
+
+        Repeated requests before the rebuild runs are coalesced. The
+        rebuild leaves the status bar alone; callers update it themselves.
+        """
+        if self._list_update_pending:
+            return
+        self._list_update_pending = True
+        self.root.after_idle(self._run_redaction_list_update)
+
+    def _run_redaction_list_update(self) -> None:
+        self._list_update_pending = False
+        self._update_redaction_list(update_state=False)
+
+    def _update_redaction_list(self, update_state: bool = True) -> None:
+        """Rebuild the treeview with all pending redactions."""
+        rows = [(r.id, (r.page_num + 1, r.source.capitalize(), r.description))
+                for r in self.model.all_redactions()]
+        insert = self.tree.insert
+        with self._batch_tree_update():
+            if self._tree_ids:
+                self.tree.delete(*self._tree_ids)
+            for iid, values in rows:
+                insert("", "end", iid=iid, values=values)
+        self._tree_ids = {iid for iid, _ in rows}
+        if update_state:
+            self._update_ui_state()
+
+    def _on_redaction_change(self, added: Optional[RedactionRect] = None,
+                             removed_id: Optional[str] = None) -> None:
+        """Called whenever redactions are added or removed.
+
+        A single add or remove patches the treeview in place; anything
+        else rebuilds it.
+        """
+        if added is not None:
+            self._insert_tree_rows(added.page_num, [added])
+        elif removed_id is not None:
+            if removed_id in self._tree_ids:
+                self._tree_ids.discard(removed_id)
+                self.tree.delete(removed_id)
+            self._update_ui_state()
+        else:
+            self._update_redaction_list()
 
     # -- File operations ------------------------------------------------------
 
@@ -721,6 +1373,10 @@ class RedactorApp:
         if not path:
             return
         try:
+            self._dismiss_confirm()
+            self._stop_search()
+            self.renderer.cancel_pending()
+            self._search_cache.clear()
             self.model.open_document(path)
             self.renderer.invalidate()
             self._update_redaction_list()
@@ -732,6 +1388,8 @@ class RedactorApp:
     def _on_save(self) -> None:
         if not self.model.doc:
             return
+        if self._refuse_while_searching("save"):
+            return
 
         # Warn about unapplied redactions
         if self.model.has_pending():
@@ -745,8 +1403,8 @@ class RedactorApp:
             )
             if answer is None:
                 return
-            if answer:
-                self._do_apply()
+            if answer and not self._do_apply():
+                return
 
         # Determine default filename
         base = os.path.splitext(os.path.basename(self.model.file_path))[0]
@@ -764,7 +1422,13 @@ class RedactorApp:
             return
 
         try:
-            self.model.save_document(path)
+            self._stop_search()
+            self.renderer.cancel_pending()
+            self._search_cache.clear()
+            try:
+                self.model.save_document(path)
+            finally:
+                self.renderer.invalidate()  # scrub may have changed any page
             messagebox.showinfo("Saved", f"Redacted PDF saved to:\n{path}")
             self.status_label.config(text=f"Saved to {os.path.basename(path)}")
         except Exception as e:
@@ -775,6 +1439,10 @@ class RedactorApp:
             if not messagebox.askyesno("Close",
                                         "Discard pending redactions?"):
                 return
+        self._dismiss_confirm()
+        self._stop_search()
+        self.renderer.cancel_pending()
+        self._search_cache.clear()
         self.model.close_document()
         self.renderer.invalidate()
         self.canvas.delete("all")
@@ -799,8 +1467,9 @@ class RedactorApp:
         try:
             page = int(self.page_entry.get()) - 1  # 1-indexed input
             if 0 <= page < self.model.page_count:
-                self.model.current_page = page
-                self._refresh_page()
+                if page != self.model.current_page:
+                    self.model.current_page = page
+                    self._refresh_page()
                 self.page_entry.delete(0, "end")
             else:
                 messagebox.showwarning("Invalid Page",
@@ -810,20 +1479,33 @@ class RedactorApp:
 
     def _on_mousewheel(self, event) -> None:
         """Handle mouse wheel scrolling on the canvas."""
-        self.canvas.yview_scroll(-1 * event.delta, "units")
+        self._wheel_accum += event.delta
+        if self._wheel_job is None:
+            self._wheel_job = self.root.after(WHEEL_FLUSH_MS, self._flush_wheel)
+
+    def _flush_wheel(self) -> None:
+        delta, self._wheel_accum = self._wheel_accum, 0
+        self._wheel_job = None
+        if delta:
+            self.canvas.yview_scroll(-delta, "units")
 
     # -- Canvas resize --------------------------------------------------------
 
     def _on_canvas_configure(self, event) -> None:
         """Debounced handler for canvas resize."""
+        # Pages are fit to width, so height-only changes need no redraw
+        if event.width == self._canvas_width:
+            return
+        self._canvas_width = event.width
         if self._resize_job:
             self.root.after_cancel(self._resize_job)
-        self._resize_job = self.root.after(200, self._do_resize)
+        self._resize_job = self.root.after(RESIZE_DEBOUNCE_MS, self._do_resize)
 
     def _do_resize(self) -> None:
         self._resize_job = None
         if self.model.doc:
-            self._refresh_page()
+            self.controller.display_page(self.model.current_page)
+            self._schedule_prefetch()
 
     # -- Search ---------------------------------------------------------------
 
@@ -835,38 +1517,189 @@ class RedactorApp:
             self.search_status.config(text="Enter text to search for")
             return
 
-        results = self.model.search_text(text)
-        if not results:
-            self.search_status.config(text="No matches found")
+        self._stop_search()
+        self._search_token += 1
+        key = (id(self.model.doc), text.translate(SEARCH_CASE_FOLD))
+        run = SearchRun(token=self._search_token, text=text, cache_key=key)
+        self._search_run = run
+
+        # A repeated query replays the stored hits instead of scanning pages
+        cached = self._search_cache.get(key)
+        if cached is not None:
+            self._search_cache.move_to_end(key)
+            for page_num, quads in cached.items():
+                self._on_search_page(run.token, page_num, quads)
+            self._finish_search(run.token)
             return
 
-        total_matches = 0
-        pages_with_matches = len(results)
+        run.results = {}
+        self._search_stop = threading.Event()
+        self._search_queue = queue.Queue()
+        self._search_thread = threading.Thread(
+            target=self._search_worker,
+            args=(run.token, self.model.iter_search(text),
+                  self._search_stop, self._search_queue),
+            daemon=True,
+        )
+        self.search_cancel_btn.config(state="normal")
+        self.search_status.config(text="Searching…")
+        self._update_ui_state()
+        self._search_thread.start()
+        self._search_poll_job = self.root.after(SEARCH_POLL_MS, self._poll_search)
 
-        for page_num, quads in results.items():
-            for q in quads:
-                rect = q.rect  # bounding rect of the quad
-                redaction = RedactionRect.create(
-                    page_num=page_num,
-                    pdf_rect=(rect.x0, rect.y0, rect.x1, rect.y1),
-                    source="search",
-                    search_term=text,
-                )
-                self.model.add_redaction(redaction)
-                total_matches += 1
+    @staticmethod
+    def _search_worker(token: int, pages: Iterator[Tuple[int, list]],
+                       stop: threading.Event, out: "queue.Queue[tuple]") -> None:
+        """Scan pages off the Tk thread, queueing each page's hits.
+
+        Never calls into Tk: _stop_search joins this thread from the Tk
+        thread, so a cross-thread Tk call here could deadlock.
+        """
+        try:
+            for page_num, quads in pages:
+                if stop.is_set():
+                    return
+                out.put(("page", token, page_num, quads))
+        except Exception as e:
+            out.put(("done", token, e))
+            return
+        out.put(("done", token, None))
+
+    def _poll_search(self) -> None:
+        """Collect queued worker results on the Tk thread."""
+        self._search_poll_job = None
+        for _ in range(SEARCH_POLL_BATCH):
+            try:
+                item = self._search_queue.get_nowait()
+            except queue.Empty:
+                break
+            if item[0] == "page":
+                self._on_search_page(*item[1:])
+            else:
+                _, token, error = item
+                self._finish_search(token, error=error)
+        if self._search_run is not None:
+            self._search_poll_job = self.root.after(SEARCH_POLL_MS,
+                                                    self._poll_search)
+
+    def _on_search_page(self, token: int, page_num: int, quads: list) -> None:
+        """Add one page's hits as redactions (Tk thread)."""
+        run = self._search_run
+        if run is None or token != run.token:
+            return
+
+        if quads:
+            if run.results is not None:
+                run.results[page_num] = quads
+            added = RedactionRect.create_many(
+                page_num,
+                [_rect_of(q.rect) for q in quads],  # bounding rect of each quad
+                source="search",
+                search_term=run.text,
+            )
+            self.model.add_redactions(added)
+            self._insert_tree_rows(page_num, added)
+            if page_num == self.model.current_page:
+                self.controller.sync_overlays(page_num)
+            run.total_matches += len(added)
+            run.pages_with_matches += 1
+            if run.first_page is None or page_num < run.first_page:
+                run.first_page = page_num
+        run.last_page = page_num
 
         self.search_status.config(
-            text=f"Found {total_matches} match{'es' if total_matches != 1 else ''} "
-                 f"on {pages_with_matches} page{'s' if pages_with_matches != 1 else ''}"
+            text=f"Searching page {page_num + 1}/{self.model.page_count} — "
+                 f"{run.total_matches} match{'es' if run.total_matches != 1 else ''}"
         )
 
-        # Navigate to first match
-        first_page = min(results.keys())
-        self.model.current_page = first_page
+    def _finish_search(self, token: int, cancelled: bool = False,
+                       error: Optional[Exception] = None) -> None:
+        run = self._search_run
+        if run is None or token != run.token:
+            return
+        self._search_run = None
+        self.search_cancel_btn.config(state="disabled")
+        self._update_ui_state()
 
-        self._update_redaction_list()
+        if error is not None:
+            self.search_status.config(text=f"Search failed: {error}")
+            return
+        if not cancelled and run.results is not None:
+            self._search_cache[run.cache_key] = run.results
+            if len(self._search_cache) > SEARCH_RESULTS_CACHE_LIMIT:
+                self._search_cache.popitem(last=False)
+
+        total_matches = run.total_matches
+        pages_with_matches = run.pages_with_matches
+        if not total_matches:
+            self.search_status.config(
+                text="Search cancelled" if cancelled else "No matches found")
+            return
+
+        status = (f"Found {total_matches} match{'es' if total_matches != 1 else ''} "
+                  f"on {pages_with_matches} page{'s' if pages_with_matches != 1 else ''}")
+        if cancelled:
+            status += " (cancelled)"
+        self.search_status.config(text=status)
+
+        # Navigate to first match
+        self.model.current_page = run.first_page
         self._refresh_page()
 
+    def _on_search_cancel(self) -> None:
+        """Stop scanning but keep the matches found so far."""
+        if self._search_run is None:
+            return
+        self._search_stop.set()
+        self._finish_search(self._search_run.token, cancelled=True)
+
+    def _stop_search(self) -> None:
+        """Abandon a running search immediately, e.g. before the doc changes.
+
+        Waits for the worker to finish its current page so nothing touches
+        the document afterwards.
+        """
+        self._search_stop.set()
+        if self._search_thread is not None:
+            self._search_thread.join()
+            self._search_thread = None
+        if self._search_poll_job:
+            self.root.after_cancel(self._search_poll_job)
+            self._search_poll_job = None
+        run = self._search_run
+        if run is not None:
+            self._search_run = None
+            # Never silent: say how far the scan got before it was dropped
+            scanned = 0 if run.last_page is None else run.last_page + 1
+            self.search_status.config(
+                text=f"Search stopped at page {scanned}/{self.model.page_count}")
+            self._update_ui_state()
+        self.search_cancel_btn.config(state="disabled")
+
+    def _refuse_while_searching(self, action: str) -> bool:
+        """Tell the user to let Find All finish first; True if it is running."""
+        if self._search_run is None:
+            return False
+        messagebox.showinfo(
+            "Search in Progress",
+            f"Find All is still scanning pages.\n\n"
+            f"Wait for it to finish, or cancel it, before you {action}.",
+        )
+        return True
+
+    def _insert_tree_rows(self, page_num: int,
+                          redactions: List[RedactionRect]) -> None:
+        """Add rows for new redactions on one page, keeping page order."""
+        index = sum(len(rects) for p, rects in self.model.pending.items()
+                    if p <= page_num) - len(redactions)
+        with self._batch_tree_update():
+            for offset, r in enumerate(redactions):
+                self.tree.insert("", index + offset, iid=r.id,
+                                 values=(r.page_num + 1, r.source.capitalize(),
+                                         r.description))
+        self._tree_ids.update(r.id for r in redactions)
+        self._update_ui_state()
+
     # -- Redaction management -------------------------------------------------
 
     def _on_tree_select(self, event=None) -> None:
@@ -876,14 +1709,13 @@ class RedactorApp:
             return
 
         rid = selection[0]
-        # Find the redaction to get its page
-        for r in self.model.all_redactions():
-            if r.id == rid:
-                if r.page_num != self.model.current_page:
-                    self.model.current_page = r.page_num
-                    self._refresh_page()
-                self.controller.select_redaction(rid)
-                break
+        r = self.model.get_redaction(rid)
+        if r is None:
+            return
+        if r.page_num != self.model.current_page:
+            self.model.current_page = r.page_num
+            self._refresh_page()
+        self.controller.select_redaction(rid)
 
     def _on_remove_selected(self) -> None:
         selection = self.tree.selection()
@@ -892,12 +1724,12 @@ class RedactorApp:
         rid = selection[0]
         self.model.remove_redaction(rid)
         self.controller._remove_overlay(rid)
-        self._on_redaction_change()
+        self._on_redaction_change(removed_id=rid)
 
     def _on_clear_page(self) -> None:
         removed = self.model.clear_page_redactions(self.model.current_page)
         if removed:
-            self._refresh_page()
+            self.controller.sync_overlays(self.model.current_page)
             self._on_redaction_change()
 
     def _on_clear_all(self) -> None:
@@ -906,52 +1738,106 @@ class RedactorApp:
         if messagebox.askyesno("Clear All",
                                 "Remove all pending redactions?"):
             self.model.clear_all_redactions()
-            self._refresh_page()
+            self.controller.sync_overlays(self.model.current_page)
             self._on_redaction_change()
 
     # -- Apply redactions -----------------------------------------------------
 
     def _on_apply(self) -> None:
+        if self._refuse_while_searching("apply redactions"):
+            return
         if not self.model.has_pending():
             messagebox.showinfo("Nothing to Apply",
                                 "No pending redactions to apply.")
             return
 
+        self._confirm_apply(self._do_apply)
+
+    def _apply_prompt(self) -> str:
         count = self.model.redaction_count()
         pages = len(self.model.pending)
-
-        answer = messagebox.askyesno(
-            "Apply Redactions",
+        return (
             f"Apply {count} redaction{'s' if count != 1 else ''} "
             f"across {pages} page{'s' if pages != 1 else ''}?\n\n"
             "This will PERMANENTLY remove the content under\n"
             "the marked areas. This cannot be undone.\n\n"
-            "The original file will not be modified until you Save.",
+            "The original file will not be modified until you Save."
         )
-        if not answer:
-            return
 
-        self._do_apply()
+    def _confirm_apply(self, callback: Callable[[], None]) -> None:
+        """Ask before applying, without blocking the event loop.
+
+        Unlike messagebox.askyesno this returns at once; callback runs
+        from the Yes button. Only one dialog is shown at a time.
+        """
+        if self._confirm_dialog is not None:
+            self._confirm_dialog.lift()
+            return
 
-    def _do_apply(self) -> None:
-        """Actually apply the redactions."""
+        dialog = tk.Toplevel(self.root)
+        dialog.title("Apply Redactions")
+        dialog.transient(self.root)
+        dialog.resizable(False, False)
+
+        frame = ttk.Frame(dialog, padding=12)
+        frame.pack(fill=tk.BOTH, expand=True)
+        self._confirm_label = ttk.Label(frame, text=self._apply_prompt(),
+                                        justify=tk.LEFT)
+        self._confirm_label.pack(anchor=tk.W)
+
+        def on_yes() -> None:
+            self._dismiss_confirm()
+            if self.model.has_pending():
+                callback()
+
+        btn_row = ttk.Frame(frame)
+        btn_row.pack(anchor=tk.E, pady=(12, 0))
+        no_btn = ttk.Button(btn_row, text="No", command=self._dismiss_confirm)
+        no_btn.pack(side=tk.RIGHT)
+        self._confirm_yes_btn = ttk.Button(btn_row, text="Yes", command=on_yes)
+        self._confirm_yes_btn.pack(side=tk.RIGHT, padx=(0, 6))
+
+        dialog.protocol("WM_DELETE_WINDOW", self._dismiss_confirm)
+        dialog.bind("<Escape>", lambda e: self._dismiss_confirm())
+        no_btn.focus_set()  # destructive action; don't default to Yes
+        self._confirm_dialog = dialog
+
+    def _dismiss_confirm(self) -> None:
+        if self._confirm_dialog is not None:
+            self._confirm_dialog.destroy()
+            self._confirm_dialog = None
+            self._confirm_label = None
+            self._confirm_yes_btn = None
+
+    def _do_apply(self) -> bool:
+        """Actually apply the redactions. Returns True if they were applied."""
+        if self._refuse_while_searching("apply redactions"):
+            return False
         try:
-            count = self.model.apply_redactions()
-            self.renderer.invalidate()  # force re-render all pages
+            self._stop_search()
+            self.renderer.cancel_pending()
+            self._search_cache.clear()
+            count, affected_pages = self.model.apply_redactions()
+            # Only modified pages need re-rendering; neighbors stay warm
+            self.renderer.invalidate(affected_pages)
             self._refresh_page()
-            self._update_redaction_list()
+            self._schedule_redaction_list_update()
             self.search_status.config(text="")
             self.status_label.config(
                 text=f"Applied {count} redaction{'s' if count != 1 else ''}. "
                      "Save to write to file."
             )
+            return True
         except Exception as e:
+            self.renderer.invalidate()  # unknown which pages changed
             messagebox.showerror("Error", f"Failed to apply redactions:\n{e}")
+            return False
 
     # -- Run ------------------------------------------------------------------
 
     def run(self) -> None:
         self.root.mainloop()
+        self.renderer.shutdown()
 
 
 # ---------------------------------------------------------------------------